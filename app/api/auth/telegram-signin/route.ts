@@ -1,5 +1,5 @@
 import { NextRequest, NextResponse } from "next/server";
-import { createClient } from "@supabase/supabase-js";
+import { createClient, SupabaseClient } from "@supabase/supabase-js";
 import crypto from "crypto";
 
 interface TelegramUser {
@@ -12,6 +12,32 @@ interface TelegramUser {
   hash: string;
 }
 
+// Supabase admin client, created on first use and reused across requests
+let supabaseAdminClient: SupabaseClient | null = null;
+
+function getSupabaseAdmin(): SupabaseClient {
+  if (!supabaseAdminClient) {
+    supabaseAdminClient = createClient(
+      process.env.NEXT_PUBLIC_SUPABASE_URL!,
+      process.env.SUPABASE_SERVICE_ROLE_KEY!,
+    );
+  }
+  return supabaseAdminClient;
+}
+
+// Secret key derived from the bot token, computed once per token
+let cachedSecretKey: { botToken: string; key: Buffer } | null = null;
+
+function getSecretKey(botToken: string): Buffer {
+  if (cachedSecretKey?.botToken !== botToken) {
+    cachedSecretKey = {
+      botToken,
+      key: crypto.createHash("sha256").update(botToken).digest(),
+    };
+  }
+  return cachedSecretKey.key;
+}
+
 // Validate Telegram authentication data
 function validateTelegramAuth(
   telegramUser: TelegramUser,
@@ -25,8 +51,7 @@ function validateTelegramAuth(
     .map((key) => `${key}=${dataToCheck[key as keyof typeof dataToCheck]}`)
     .join("\n");
 
-  // Create secret key
-  const secretKey = crypto.createHash("sha256").update(botToken).digest();
+  const secretKey = getSecretKey(botToken);
 
   // Create hash
   const calculatedHash = crypto
@@ -35,9 +60,8 @@ function validateTelegramAuth(
     .digest("hex");
 
   // Check if auth is not too old (24 hours)
-  const authDate = new Date(telegramUser.auth_date * 1000);
-  const now = new Date();
-  const diffHours = (now.getTime() - authDate.getTime()) / (1000 * 60 * 60);
+  const diffHours =
+    (Date.now() - telegramUser.auth_date * 1000) / (1000 * 60 * 60);
 
   return calculatedHash === hash && diffHours < 24;
 }
@@ -71,13 +95,11 @@ export async function POST(request: NextRequest) {
       );
     }
 
-    // Create Supabase admin client for user management
-    const supabaseAdmin = createClient(
-      process.env.NEXT_PUBLIC_SUPABASE_URL!,
-      process.env.SUPABASE_SERVICE_ROLE_KEY!,
-    );
+    // Supabase admin client for user management
+    const supabaseAdmin = getSupabaseAdmin();
 
     const telegramEmail = `telegram_${telegramUser.id}@telegram.local`;
+    const now = new Date().toISOString();
 
     // Check if user already exists by telegram_user_id
     const { data: existingProfile } = await supabaseAdmin
@@ -104,13 +126,13 @@ export async function POST(request: NextRequest) {
           telegram_username: telegramUser.username,
           telegram_first_name: telegramUser.first_name,
           telegram_last_name: telegramUser.last_name,
-          telegram_linked_at: new Date().toISOString(),
+          telegram_linked_at: now,
           telegram_active: true,
           avatar_url: telegramUser.photo_url,
           display_name:
             telegramUser.first_name +
             (telegramUser.last_name ? ` ${telegramUser.last_name}` : ""),
-          updated_at: new Date().toISOString(),
+          updated_at: now,
         })
         .eq("id", userId);
     } else {
@@ -147,15 +169,15 @@ export async function POST(request: NextRequest) {
         telegram_username: telegramUser.username,
         telegram_first_name: telegramUser.first_name,
         telegram_last_name: telegramUser.last_name,
-        telegram_linked_at: new Date().toISOString(),
+        telegram_linked_at: now,
         telegram_active: true,
         avatar_url: telegramUser.photo_url,
         display_name:
           telegramUser.first_name +
           (telegramUser.last_name ? ` ${telegramUser.last_name}` : ""),
         signup_method: "telegram",
-        created_at: new Date().toISOString(),
-        updated_at: new Date().toISOString(),
+        created_at: now,
+        updated_at: now,
       });
     }
 
@@ -1,3 +1,8 @@
+import {
+  responseCache,
+  RESPONSE_TTL,
+} from "../../../lib/services/response-cache";
+
 export async function POST(request: Request) {
   try {
     const { symbol } = await request.json();
@@ -11,37 +16,17 @@ export async function POST(request: Request) {
 
     console.log(`📊 Calling centralized stock data function for ${symbol}...`);
 
-    // Call the centralized Supabase Edge Function
-    const supabaseUrl = process.env.NEXT_PUBLIC_SUPABASE_URL;
-    const supabaseAnonKey = process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY;
-
-    if (!supabaseUrl || !supabaseAnonKey) {
-      throw new Error("Supabase configuration missing");
-    }
-
-    const response = await fetch(
-      `${supabaseUrl}/functions/v1/yahoo-stock-data`,
-      {
-        method: "POST",
-        headers: {
-          Authorization: `Bearer ${supabaseAnonKey}`,
-          "Content-Type": "application/json",
-        },
-        body: JSON.stringify({ symbol }),
-      },
-    );
-
-    if (!response.ok) {
-      const errorData = await response.json();
-      throw new Error(errorData.error || "Failed to fetch stock data");
-    }
-
-    const stockData = await response.json();
-    console.log(
-      `✅ Stock data received for ${symbol}, price: ${stockData.currentPrice}`,
+    const stockDataJson = await responseCache.getOrFetch(
+      `yahoo-stock-data:${symbol.toUpperCase()}`,
+      RESPONSE_TTL.stockData,
+      () => fetchStockData(symbol),
     );
+    console.log(`✅ Stock data received for ${symbol}`);
 
-    return Response.json(stockData);
+    // Upstream body is already JSON, so pass it through without re-encoding
+    return new Response(stockDataJson, {
+      headers: { "Content-Type": "application/json" },
+    });
   } catch (error) {
     console.error("❌ Error in simple stock data API route:", error);
     return Response.json(
@@ -50,3 +35,32 @@ export async function POST(request: Request) {
     );
   }
 }
+
+async function fetchStockData(symbol: string) {
+  // Call the centralized Supabase Edge Function
+  const supabaseUrl = process.env.NEXT_PUBLIC_SUPABASE_URL;
+  const supabaseAnonKey = process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY;
+
+  if (!supabaseUrl || !supabaseAnonKey) {
+    throw new Error("Supabase configuration missing");
+  }
+
+  const response = await fetch(
+    `${supabaseUrl}/functions/v1/yahoo-stock-data`,
+    {
+      method: "POST",
+      headers: {
+        Authorization: `Bearer ${supabaseAnonKey}`,
+        "Content-Type": "application/json",
+      },
+      body: JSON.stringify({ symbol }),
+    },
+  );
+
+  if (!response.ok) {
+    const errorData = await response.json();
+    throw new Error(errorData.error || "Failed to fetch stock data");
+  }
+
+  return response.text();
+}
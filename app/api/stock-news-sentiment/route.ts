@@ -1,3 +1,8 @@
+import {
+  responseCache,
+  RESPONSE_TTL,
+} from "../../../lib/services/response-cache";
+
 export async function POST(request: Request) {
   try {
     const { symbol } = await request.json();
@@ -13,37 +18,17 @@ export async function POST(request: Request) {
       `📰 Calling centralized news sentiment function for ${symbol}...`,
     );
 
-    // Call the centralized Supabase Edge Function
-    const supabaseUrl = process.env.NEXT_PUBLIC_SUPABASE_URL;
-    const supabaseAnonKey = process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY;
-
-    if (!supabaseUrl || !supabaseAnonKey) {
-      throw new Error("Supabase configuration missing");
-    }
-
-    const response = await fetch(
-      `${supabaseUrl}/functions/v1/yahoo-news-sentiment`,
-      {
-        method: "POST",
-        headers: {
-          Authorization: `Bearer ${supabaseAnonKey}`,
-          "Content-Type": "application/json",
-        },
-        body: JSON.stringify({ symbol }),
-      },
-    );
-
-    if (!response.ok) {
-      const errorData = await response.json();
-      throw new Error(errorData.error || "Failed to fetch news and sentiment");
-    }
-
-    const newsData = await response.json();
-    console.log(
-      `✅ News data received for ${symbol}, sentiment: ${newsData.sentiment?.overall}`,
+    const newsDataJson = await responseCache.getOrFetch(
+      `yahoo-news-sentiment:${symbol.toUpperCase()}`,
+      RESPONSE_TTL.newsSentiment,
+      () => fetchNewsSentiment(symbol),
     );
+    console.log(`✅ News data received for ${symbol}`);
 
-    return Response.json(newsData);
+    // Upstream body is already JSON, so pass it through without re-encoding
+    return new Response(newsDataJson, {
+      headers: { "Content-Type": "application/json" },
+    });
   } catch (error) {
     console.error("❌ Error in news sentiment API route:", error);
     return Response.json(
@@ -52,3 +37,32 @@ export async function POST(request: Request) {
     );
   }
 }
+
+async function fetchNewsSentiment(symbol: string) {
+  // Call the centralized Supabase Edge Function
+  const supabaseUrl = process.env.NEXT_PUBLIC_SUPABASE_URL;
+  const supabaseAnonKey = process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY;
+
+  if (!supabaseUrl || !supabaseAnonKey) {
+    throw new Error("Supabase configuration missing");
+  }
+
+  const response = await fetch(
+    `${supabaseUrl}/functions/v1/yahoo-news-sentiment`,
+    {
+      method: "POST",
+      headers: {
+        Authorization: `Bearer ${supabaseAnonKey}`,
+        "Content-Type": "application/json",
+      },
+      body: JSON.stringify({ symbol }),
+    },
+  );
+
+  if (!response.ok) {
+    const errorData = await response.json();
+    throw new Error(errorData.error || "Failed to fetch news and sentiment");
+  }
+
+  return response.text();
+}
@@ -1,3 +1,8 @@
+import {
+  responseCache,
+  RESPONSE_TTL,
+} from "../../../lib/services/response-cache";
+
 export async function POST(request: Request) {
   try {
     const { symbol } = await request.json();
@@ -11,37 +16,17 @@ export async function POST(request: Request) {
 
     console.log(`📈 Calling centralized price function for ${symbol}...`);
 
-    // Call the centralized Supabase Edge Function
-    const supabaseUrl = process.env.NEXT_PUBLIC_SUPABASE_URL;
-    const supabaseAnonKey = process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY;
-
-    if (!supabaseUrl || !supabaseAnonKey) {
-      throw new Error("Supabase configuration missing");
-    }
-
-    const response = await fetch(
-      `${supabaseUrl}/functions/v1/yahoo-stock-price`,
-      {
-        method: "POST",
-        headers: {
-          Authorization: `Bearer ${supabaseAnonKey}`,
-          "Content-Type": "application/json",
-        },
-        body: JSON.stringify({ symbol }),
-      },
-    );
-
-    if (!response.ok) {
-      const errorData = await response.json();
-      throw new Error(errorData.error || "Failed to fetch price data");
-    }
-
-    const priceData = await response.json();
-    console.log(
-      `✅ Price data received for ${symbol}: $${priceData.price?.toFixed(2)}`,
+    const priceDataJson = await responseCache.getOrFetch(
+      `yahoo-stock-price:${symbol.toUpperCase()}`,
+      RESPONSE_TTL.price,
+      () => fetchPriceData(symbol),
     );
+    console.log(`✅ Price data received for ${symbol}`);
 
-    return Response.json(priceData);
+    // Upstream body is already JSON, so pass it through without re-encoding
+    return new Response(priceDataJson, {
+      headers: { "Content-Type": "application/json" },
+    });
   } catch (error) {
     console.error("❌ Error in price API route:", error);
     return Response.json(
@@ -50,3 +35,32 @@ export async function POST(request: Request) {
     );
   }
 }
+
+async function fetchPriceData(symbol: string) {
+  // Call the centralized Supabase Edge Function
+  const supabaseUrl = process.env.NEXT_PUBLIC_SUPABASE_URL;
+  const supabaseAnonKey = process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY;
+
+  if (!supabaseUrl || !supabaseAnonKey) {
+    throw new Error("Supabase configuration missing");
+  }
+
+  const response = await fetch(
+    `${supabaseUrl}/functions/v1/yahoo-stock-price`,
+    {
+      method: "POST",
+      headers: {
+        Authorization: `Bearer ${supabaseAnonKey}`,
+        "Content-Type": "application/json",
+      },
+      body: JSON.stringify({ symbol }),
+    },
+  );
+
+  if (!response.ok) {
+    const errorData = await response.json();
+    throw new Error(errorData.error || "Failed to fetch price data");
+  }
+
+  return response.text();
+}
@@ -1,3 +1,4 @@
+import { User } from "@supabase/supabase-js";
 import { supabase } from "./supabase";
 
 export interface AuthError {
@@ -13,13 +14,54 @@ export function isAuthError(error: unknown): error is AuthError {
   );
 }
 
+// Verified user is reused briefly so consecutive API calls don't each
+// round-trip to the auth server
+const AUTH_USER_TTL = 60 * 1000; // 1 minute
+let cachedAuthUser: { user: User; expiresAt: number } | null = null;
+let pendingAuthUser: Promise<User | null> | null = null;
+let authGeneration = 0;
+
+supabase.auth.onAuthStateChange(() => {
+  authGeneration++;
+  cachedAuthUser = null;
+  pendingAuthUser = null;
+});
+
+async function fetchVerifiedUser(): Promise<User | null> {
+  if (cachedAuthUser && Date.now() < cachedAuthUser.expiresAt) {
+    return cachedAuthUser.user;
+  }
+
+  // Share one getUser() call between concurrent callers
+  if (!pendingAuthUser) {
+    const generation = authGeneration;
+    const request = supabase.auth
+      .getUser()
+      .then(({ data: { user }, error }) => {
+        if (error || !user) {
+          return null;
+        }
+        // Don't cache a user whose session changed while we were waiting
+        if (generation === authGeneration) {
+          cachedAuthUser = { user, expiresAt: Date.now() + AUTH_USER_TTL };
+        }
+        return user;
+      })
+      .finally(() => {
+        if (pendingAuthUser === request) {
+          pendingAuthUser = null;
+        }
+      });
+    pendingAuthUser = request;
+  }
+
+  return pendingAuthUser;
+}
+
 // Helper function to get authenticated user
 async function getAuthenticatedUser() {
-  const {
-    data: { user },
-    error,
-  } = await supabase.auth.getUser();
-  if (error || !user) {
+  const user = await fetchVerifiedUser();
+  if (!user) {
     return {
       error: {
         isAuthError: true,
@@ -239,11 +281,15 @@ export const saveStockNote = async (symbol: string, note: string) => {
   if (authResult.error) return authResult.error;
 
   try {
-    const { data, error } = await supabase.from("stock_notes").upsert({
-      user_id: authResult.user.id,
-      symbol,
-      note,
-    });
+    // Single atomic INSERT ... ON CONFLICT against UNIQUE(user_id, symbol)
+    const { data, error } = await supabase
+      .from("stock_notes")
+      .upsert(
+        { user_id: authResult.user.id, symbol, note },
+        { onConflict: "user_id,symbol" },
+      )
+      .select()
+      .single();
 
     if (error) throw error;
     return data;
@@ -263,11 +309,10 @@ export const getStockNote = async (symbol: string) => {
       .select("*")
       .eq("user_id", authResult.user.id)
       .eq("symbol", symbol)
-      .order("created_at", { ascending: false })
-      .limit(1);
+      .maybeSingle();
 
     if (error) throw error;
-    return data && data.length > 0 ? data[0] : null;
+    return data;
   } catch (error) {
     console.error("Error fetching stock note:", error);
     return null; // Return null instead of throwing for missing notes
@@ -377,15 +422,15 @@ export const saveTelegramSettings = async (chatId: string) => {
 };
 
 export async function getUserProfile() {
-  const { data: user } = await supabase.auth.getUser();
-  if (!user.user) {
+  const user = await fetchVerifiedUser();
+  if (!user) {
     throw new Error("Not authenticated");
   }
 
   const { data, error } = await supabase
     .from("profiles")
     .select("*")
-    .eq("id", user.user.id)
+    .eq("id", user.id)
     .single();
   if (error) {
     throw new Error(error.message);
@@ -397,8 +442,8 @@ export async function updateUserSettings(
   telegramChatId: string,
   telegramBotToken: string,
 ) {
-  const { data: user } = await supabase.auth.getUser();
-  if (!user.user) {
+  const user = await fetchVerifiedUser();
+  if (!user) {
     throw new Error("Not authenticated");
   }
 
@@ -408,7 +453,7 @@ export async function updateUserSettings(
       telegram_chat_id: telegramChatId,
       telegram_bot_token: telegramBotToken,
     })
-    .eq("id", user.user.id)
+    .eq("id", user.id)
     .select();
   if (error) {
     throw new Error(error.message);
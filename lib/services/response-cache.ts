@@ -0,0 +1,85 @@
+// Simple in-memory TTL cache for upstream market data responses
+// Concurrent requests for the same key share a single in-flight fetch
+class ResponseCache {
+  private cache = new Map<string, { data: unknown; expiresAt: number }>();
+  private inflight = new Map<string, Promise<unknown>>();
+
+  async getOrFetch<T>(
+    key: string,
+    ttl: number,
+    fetcher: () => Promise<T>,
+  ): Promise<T> {
+    const cached = this.cache.get(key);
+
+    if (cached) {
+      if (Date.now() < cached.expiresAt) {
+        console.log(`📦 Cache hit for ${key}`);
+        return cached.data as T;
+      }
+      this.cache.delete(key);
+    }
+
+    // Coalesce concurrent misses so only one upstream call fires
+    const pending = this.inflight.get(key);
+    if (pending) {
+      return pending as Promise<T>;
+    }
+
+    const request = fetcher()
+      .then((data) => {
+        this.cache.set(key, { data, expiresAt: Date.now() + ttl });
+        return data;
+      })
+      .finally(() => {
+        this.inflight.delete(key);
+      });
+
+    this.inflight.set(key, request);
+    return request;
+  }
+
+  clear(key?: string): void {
+    if (key) {
+      this.cache.delete(key);
+    } else {
+      this.cache.clear();
+    }
+  }
+
+  // Clean up expired entries periodically
+  cleanupExpired(): void {
+    const now = Date.now();
+    let cleanedCount = 0;
+
+    this.cache.forEach((value, key) => {
+      if (now >= value.expiresAt) {
+        this.cache.delete(key);
+        cleanedCount++;
+      }
+    });
+
+    if (cleanedCount > 0) {
+      console.log(`🧹 Cleaned up ${cleanedCount} expired response entries`);
+    }
+  }
+}
+
+// Export singleton instance
+export const responseCache = new ResponseCache();
+
+// Cache lifetimes per upstream endpoint
+export const RESPONSE_TTL = {
+  stockData: 5 * 60 * 1000, // 5 minutes
+  newsSentiment: 2 * 60 * 1000, // 2 minutes
+  price: 60 * 1000, // 1 minute
+};
+
+// Set up periodic cleanup every 10 minutes
+if (typeof global !== "undefined") {
+  setInterval(
+    () => {
+      responseCache.cleanupExpired();
+    },
+    10 * 60 * 1000,
+  );
+}
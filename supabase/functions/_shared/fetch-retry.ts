@@ -0,0 +1,40 @@
+// Status codes Yahoo Finance returns when throttling or briefly unavailable
+const RETRYABLE_STATUSES = new Set([429, 503]);
+
+const MAX_RETRIES = 3;
+const BASE_DELAY_MS = 500;
+const MAX_DELAY_MS = 8000;
+
+const sleep = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms));
+
+// Exponential backoff with jitter so concurrent callers don't retry in lockstep
+function getRetryDelay(attempt: number, retryAfter: string | null): number {
+  const retryAfterSeconds = retryAfter ? Number(retryAfter) : NaN;
+  if (Number.isFinite(retryAfterSeconds) && retryAfterSeconds >= 0) {
+    return Math.min(retryAfterSeconds * 1000, MAX_DELAY_MS);
+  }
+
+  const backoff = BASE_DELAY_MS * 2 ** attempt * (0.5 + Math.random());
+  return Math.min(backoff, MAX_DELAY_MS);
+}
+
+export async function fetchWithRetry(
+  url: string,
+  init?: RequestInit,
+): Promise<Response> {
+  for (let attempt = 0; ; attempt++) {
+    const response = await fetch(url, init);
+
+    if (!RETRYABLE_STATUSES.has(response.status) || attempt >= MAX_RETRIES) {
+      return response;
+    }
+
+    const delay = getRetryDelay(attempt, response.headers.get("Retry-After"));
+    console.warn(
+      `⏳ ${response.status} from upstream, retrying in ${Math.round(delay)}ms (${attempt + 1}/${MAX_RETRIES})`,
+    );
+
+    await response.body?.cancel();
+    await sleep(delay);
+  }
+}
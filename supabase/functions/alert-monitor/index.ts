@@ -16,6 +16,10 @@ interface Alert {
   alert_type: string;
   threshold: number;
   is_active: boolean;
+  profiles: {
+    telegram_chat_id: string | null;
+    telegram_bot_token: string | null;
+  } | null;
 }
 
 interface StockData {
@@ -28,21 +32,23 @@ interface StockData {
   overview: { symbol: string };
 }
 
+const SUPABASE_URL = Deno.env.get("SUPABASE_URL")!;
+const SUPABASE_SERVICE_ROLE_KEY = Deno.env.get("SUPABASE_SERVICE_ROLE_KEY")!;
+const TELEGRAM_BOT_TOKEN = Deno.env.get("TELEGRAM_BOT_TOKEN");
+
+// Global Supabase client, reused across invocations of a warm isolate
+const supabase = createClient(SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY);
+
 serve(async (req: Request) => {
   if (req.method === "OPTIONS") {
     return new Response("ok", { headers: corsHeaders });
   }
 
   try {
-    // Initialize Supabase client
-    const supabaseUrl = Deno.env.get("SUPABASE_URL")!;
-    const supabaseKey = Deno.env.get("SUPABASE_SERVICE_ROLE_KEY")!;
-    const supabase = createClient(supabaseUrl, supabaseKey);
-
-    // Get all active alerts
+    // Get all active alerts along with each owner's Telegram settings
     const { data: alerts, error: alertsError } = await supabase
       .from("alerts")
-      .select("*")
+      .select("*, profiles(telegram_chat_id, telegram_bot_token)")
       .eq("is_active", true);
 
     if (alertsError) {
@@ -58,12 +64,17 @@ serve(async (req: Request) => {
       alertsBySymbol[alert.symbol].push(alert);
     }
 
+    // Fetch data for every symbol up front, a few symbols at a time
+    const stockDataBySymbol = await getStockDataBulk(
+      Object.keys(alertsBySymbol),
+    );
+
     const results = [];
 
     // Check each symbol's alerts
     for (const [symbol, symbolAlerts] of Object.entries(alertsBySymbol)) {
       try {
-        const stockData = await getStockData(symbol);
+        const stockData = stockDataBySymbol.get(symbol);
 
         if (!stockData) {
           console.warn(`Could not fetch data for ${symbol}`);
@@ -75,7 +86,7 @@ serve(async (req: Request) => {
           const shouldTrigger = await evaluateAlertCondition(alert, stockData);
 
           if (shouldTrigger) {
-            await triggerAlert(alert, stockData, supabase);
+            await triggerAlert(alert, stockData);
             results.push({
               alert_id: alert.id,
               symbol: alert.symbol,
@@ -115,43 +126,53 @@ serve(async (req: Request) => {
   }
 });
 
-async function getStockData(symbol: string) {
-  try {
-    // Use centralized price fetching function
-    const supabaseUrl = Deno.env.get("SUPABASE_URL")!;
-    const supabaseServiceKey = Deno.env.get("SUPABASE_SERVICE_ROLE_KEY")!;
+// Upper bound on concurrent price lookups to stay within upstream quotas
+const MAX_CONCURRENT_FETCHES = 5;
 
-    const response = await fetch(
-      `${supabaseUrl}/functions/v1/yahoo-stock-price`,
-      {
-        method: "POST",
-        headers: {
-          Authorization: `Bearer ${supabaseServiceKey}`,
-          "Content-Type": "application/json",
-        },
-        body: JSON.stringify({ symbol }),
+async function getStockDataBulk(
+  symbols: string[],
+): Promise<Map<string, StockData | null>> {
+  const stockDataBySymbol = new Map<string, StockData | null>();
+  const queue = [...new Set(symbols)];
+
+  const worker = async () => {
+    while (queue.length > 0) {
+      const symbol = queue.shift()!;
+      stockDataBySymbol.set(symbol, await getStockData(symbol));
+    }
+  };
+
+  const workerCount = Math.min(MAX_CONCURRENT_FETCHES, queue.length);
+  await Promise.all(Array.from({ length: workerCount }, worker));
+
+  return stockDataBySymbol;
+}
+
+async function getStockData(symbol: string): Promise<StockData | null> {
+  try {
+    const requestInit = {
+      method: "POST",
+      headers: {
+        Authorization: `Bearer ${SUPABASE_SERVICE_ROLE_KEY}`,
+        "Content-Type": "application/json",
       },
-    );
+      body: JSON.stringify({ symbol }),
+    };
+
+    // Use centralized price function, and get stock data for moving
+    // averages calculation at the same time
+    const [response, stockDataResponse] = await Promise.all([
+      fetch(`${SUPABASE_URL}/functions/v1/yahoo-stock-price`, requestInit),
+      fetch(`${SUPABASE_URL}/functions/v1/yahoo-stock-data`, requestInit),
+    ]);
 
     if (!response.ok) {
+      await stockDataResponse.body?.cancel();
       throw new Error("Failed to fetch price data from centralized function");
     }
 
     const priceData = await response.json();
 
-    // Also get stock data for moving averages calculation
-    const stockDataResponse = await fetch(
-      `${supabaseUrl}/functions/v1/yahoo-stock-data`,
-      {
-        method: "POST",
-        headers: {
-          Authorization: `Bearer ${supabaseServiceKey}`,
-          "Content-Type": "application/json",
-        },
-        body: JSON.stringify({ symbol }),
-      },
-    );
-
     const movingAverages: { [key: string]: number } = {};
     let peRatio = null;
 
@@ -254,20 +275,12 @@ async function evaluateAlertCondition(
   }
 }
 
-async function triggerAlert(
-  alert: Alert,
-  stockData: StockData,
-  supabase: ReturnType<typeof createClient>,
-) {
+async function triggerAlert(alert: Alert, stockData: StockData) {
   try {
-    // Get user's Telegram settings
-    const { data: profile, error } = await supabase
-      .from("profiles")
-      .select("telegram_chat_id, telegram_bot_token")
-      .eq("id", alert.user_id)
-      .single();
-
-    if (error || !profile?.telegram_chat_id) {
+    // User's Telegram settings were loaded with the alert
+    const profile = alert.profiles;
+
+    if (!profile?.telegram_chat_id) {
       console.warn(`User ${alert.user_id} has no Telegram chat ID configured`);
       return;
     }
@@ -279,7 +292,7 @@ async function triggerAlert(
     await sendTelegramMessage(
       profile.telegram_chat_id,
       message,
-      profile.telegram_bot_token,
+      profile.telegram_bot_token ?? undefined,
     );
 
     console.log(`Alert triggered for ${alert.symbol} - ${alert.alert_type}`);
@@ -338,7 +351,7 @@ async function sendTelegramMessage(
   message: string,
   botToken?: string,
 ) {
-  const telegramBotToken = botToken || Deno.env.get("TELEGRAM_BOT_TOKEN");
+  const telegramBotToken = botToken || TELEGRAM_BOT_TOKEN;
   if (!telegramBotToken) {
     throw new Error("Telegram bot token not configured");
   }
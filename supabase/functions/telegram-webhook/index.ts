@@ -655,6 +655,9 @@ const TELEGRAM_BOT_TOKEN = Deno.env.get("TELEGRAM_BOT_TOKEN");
 const SUPABASE_URL = Deno.env.get("SUPABASE_URL")!;
 const SUPABASE_SERVICE_ROLE_KEY = Deno.env.get("SUPABASE_SERVICE_ROLE_KEY")!;
 
+// Bot API endpoint, built once for every outgoing Telegram call
+const TELEGRAM_API_URL = `https://api.telegram.org/bot${TELEGRAM_BOT_TOKEN}`;
+
 // Global Supabase client
 const supabase = createClient(SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY);
 
@@ -1711,9 +1714,32 @@ async function handleWatchlistCommand(
       };
     }
 
+    const visibleItems = watchlist.slice(0, 15);
+
+    // Fetch active alerts for all listed symbols in one query
+    const { data: activeAlerts } = await supabase
+      .from("alerts")
+      .select("symbol, target_price, condition")
+      .eq("user_id", user.id)
+      .eq("is_active", true)
+      .in("symbol", visibleItems.map((item) => item.symbol));
+
+    const alertsBySymbol = new Map<
+      string,
+      { target_price: number; condition: string }[]
+    >();
+    for (const alert of activeAlerts || []) {
+      const symbolAlerts = alertsBySymbol.get(alert.symbol) || [];
+      symbolAlerts.push({
+        target_price: alert.target_price,
+        condition: alert.condition,
+      });
+      alertsBySymbol.set(alert.symbol, symbolAlerts);
+    }
+
     // Fetch real-time price data for all stocks
     const enrichedWatchlist = await Promise.all(
-      watchlist.slice(0, 15).map(async (item) => {
+      visibleItems.map(async (item) => {
         try {
           // Fetch real-time price data
           console.log(
@@ -1742,8 +1768,7 @@ async function handleWatchlistCommand(
             try {
               priceData = await priceResponse.json();
               console.log(
-                `📈 Raw price data for ${item.symbol}:`,
-                JSON.stringify(priceData, null, 2),
+                `📈 Price data for ${item.symbol}: $${priceData.price}`,
               );
             } catch (jsonError) {
               console.error(
@@ -1763,36 +1788,10 @@ async function handleWatchlistCommand(
             console.error(`📄 Error response body:`, errorText);
           }
 
-          // Fetch alert status
-          const { data: alerts } = await supabase
-            .from("alerts")
-            .select("target_price, condition")
-            .eq("user_id", user.id)
-            .eq("symbol", item.symbol)
-            .eq("is_active", true);
-
-          // Update company name in database if we got it from price data
-          if (priceData && priceData.name && priceData.name !== item.symbol) {
-            try {
-              await supabase
-                .from("watchlist_items")
-                .update({ company_name: priceData.name })
-                .eq("id", item.id);
-              console.log(
-                `✅ Updated company name for ${item.symbol}: ${priceData.name}`,
-              );
-            } catch (updateError) {
-              console.error(
-                `❌ Failed to update company name for ${item.symbol}:`,
-                updateError,
-              );
-            }
-          }
-
           return {
             ...item,
             priceData,
-            alerts: alerts || [],
+            alerts: alertsBySymbol.get(item.symbol) || [],
           };
         } catch (error) {
           console.error(`Error fetching data for ${item.symbol}:`, error);
@@ -1805,6 +1804,34 @@ async function handleWatchlistCommand(
       }),
     );
 
+    // Store company names learned from price data, skipping unchanged rows
+    const renamedItems = enrichedWatchlist.filter(
+      (item) =>
+        item.priceData?.name &&
+        item.priceData.name !== item.symbol &&
+        item.priceData.name !== item.company_name,
+    );
+
+    await Promise.all(
+      renamedItems.map(async (item) => {
+        const { error: updateError } = await supabase
+          .from("watchlist_items")
+          .update({ company_name: item.priceData.name })
+          .eq("id", item.id);
+
+        if (updateError) {
+          console.error(
+            `❌ Failed to update company name for ${item.symbol}:`,
+            updateError,
+          );
+        } else {
+          console.log(
+            `✅ Updated company name for ${item.symbol}: ${item.priceData.name}`,
+          );
+        }
+      }),
+    );
+
     const result = formatWatchlistForTelegram(enrichedWatchlist);
     return {
       response: result.response,
@@ -1852,16 +1879,13 @@ async function sendTelegramMessage(
       body.reply_markup = replyMarkup;
     }
 
-    const response = await fetch(
-      `https://api.telegram.org/bot${TELEGRAM_BOT_TOKEN}/sendMessage`,
-      {
-        method: "POST",
-        headers: {
-          "Content-Type": "application/json",
-        },
-        body: JSON.stringify(body),
+    const response = await fetch(`${TELEGRAM_API_URL}/sendMessage`, {
+      method: "POST",
+      headers: {
+        "Content-Type": "application/json",
       },
-    );
+      body: JSON.stringify(body),
+    });
 
     if (!response.ok) {
       const errorData = await response.text();
@@ -1942,19 +1966,16 @@ async function sendChatAction(chatId: string, action: string): Promise<void> {
   }
 
   try {
-    await fetch(
-      `https://api.telegram.org/bot${TELEGRAM_BOT_TOKEN}/sendChatAction`,
-      {
-        method: "POST",
-        headers: {
-          "Content-Type": "application/json",
-        },
-        body: JSON.stringify({
-          chat_id: chatId,
-          action: action,
-        }),
+    await fetch(`${TELEGRAM_API_URL}/sendChatAction`, {
+      method: "POST",
+      headers: {
+        "Content-Type": "application/json",
       },
-    );
+      body: JSON.stringify({
+        chat_id: chatId,
+        action: action,
+      }),
+    });
   } catch (error) {
     console.error("❌ Error sending chat action:", error);
   }
@@ -2010,19 +2031,16 @@ async function handleCallbackQuery(callbackQuery: any): Promise<void> {
     }
 
     // Answer callback query
-    await fetch(
-      `https://api.telegram.org/bot${TELEGRAM_BOT_TOKEN}/answerCallbackQuery`,
-      {
-        method: "POST",
-        headers: {
-          "Content-Type": "application/json",
-        },
-        body: JSON.stringify({
-          callback_query_id: callbackQueryId,
-          text: "✅ Action completed",
-        }),
+    await fetch(`${TELEGRAM_API_URL}/answerCallbackQuery`, {
+      method: "POST",
+      headers: {
+        "Content-Type": "application/json",
       },
-    );
+      body: JSON.stringify({
+        callback_query_id: callbackQueryId,
+        text: "✅ Action completed",
+      }),
+    });
 
     // Send response message
     await sendTelegramMessage(chatId, response);
@@ -2030,19 +2048,16 @@ async function handleCallbackQuery(callbackQuery: any): Promise<void> {
     console.error("Error handling callback query:", error);
 
     // Answer callback query with error
-    await fetch(
-      `https://api.telegram.org/bot${TELEGRAM_BOT_TOKEN}/answerCallbackQuery`,
-      {
-        method: "POST",
-        headers: {
-          "Content-Type": "application/json",
-        },
-        body: JSON.stringify({
-          callback_query_id: callbackQueryId,
-          text: "❌ Action failed",
-        }),
+    await fetch(`${TELEGRAM_API_URL}/answerCallbackQuery`, {
+      method: "POST",
+      headers: {
+        "Content-Type": "application/json",
       },
-    );
+      body: JSON.stringify({
+        callback_query_id: callbackQueryId,
+        text: "❌ Action failed",
+      }),
+    });
   }
 }
 
@@ -2064,15 +2079,14 @@ async function handleAddCommand(
   }
 
   try {
-    // Check if already in watchlist
-    const { data: existing } = await supabase
+    // Check if already in watchlist (count only, no row payload)
+    const { count: existingCount } = await supabase
       .from("watchlist_items")
-      .select("id")
+      .select("id", { count: "exact", head: true })
       .eq("user_id", user.id)
-      .eq("symbol", symbol)
-      .single();
+      .eq("symbol", symbol);
 
-    if (existing) {
+    if (existingCount) {
       return `⭐ *${symbol}* is already in your watchlist.\n\n💡 Use /watchlist to view your list or /remove ${symbol} to remove it.`;
     }
 
@@ -2140,24 +2154,13 @@ async function handleRemoveCommand(
   }
 
   try {
-    // Check if exists in watchlist
-    const { data: existing } = await supabase
-      .from("watchlist_items")
-      .select("id")
-      .eq("user_id", user.id)
-      .eq("symbol", symbol)
-      .single();
-
-    if (!existing) {
-      return `📭 *${symbol}* is not in your watchlist.\n\n💡 Use /watchlist to see your stocks or /add ${symbol} to add it.`;
-    }
-
-    // Remove from watchlist
-    const { error } = await supabase
+    // Remove from watchlist, returning the deleted rows to detect a miss
+    const { data: removed, error } = await supabase
       .from("watchlist_items")
       .delete()
       .eq("user_id", user.id)
-      .eq("symbol", symbol);
+      .eq("symbol", symbol)
+      .select("id");
 
     if (error) {
       console.error("Error removing from watchlist:", error);
@@ -2166,6 +2169,10 @@ async function handleRemoveCommand(
       );
     }
 
+    if (!removed || removed.length === 0) {
+      return `📭 *${symbol}* is not in your watchlist.\n\n💡 Use /watchlist to see your stocks or /add ${symbol} to add it.`;
+    }
+
     return `🗑️ *${symbol}* removed from your watchlist.\n\n📱 **Quick actions:**\n• /watchlist - View your updated list\n• /add ${symbol} - Add it back\n• /research ${symbol} - Analyze this stock`;
   } catch (error) {
     console.error("Error handling remove command:", error);
@@ -2199,15 +2206,14 @@ async function handleWatchlistAdd(
   }
 
   try {
-    // Check if already in watchlist
-    const { data: existing } = await supabase
+    // Check if already in watchlist (count only, no row payload)
+    const { count: existingCount } = await supabase
       .from("watchlist_items")
-      .select("id")
+      .select("id", { count: "exact", head: true })
       .eq("user_id", profile.id)
-      .eq("symbol", symbol)
-      .single();
+      .eq("symbol", symbol);
 
-    if (existing) {
+    if (existingCount) {
       return `⭐ *${symbol}* is already in your watchlist.\n\n💡 View your watchlist in the web app or use /watchlist command.`;
     }
 
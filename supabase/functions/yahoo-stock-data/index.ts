@@ -1,6 +1,7 @@
 import "jsr:@supabase/functions-js/edge-runtime.d.ts";
 import { serve } from "https://deno.land/std@0.208.0/http/server.ts";
 import { corsHeaders } from "../_shared/cors.ts";
+import { fetchWithRetry } from "../_shared/fetch-retry.ts";
 
 interface YahooFinanceValue {
   raw?: number;
@@ -123,13 +124,29 @@ serve(async (req) => {
 
     console.log(`Fetching Yahoo Finance data for: ${symbol}`);
 
-    // Fetch historical price data (chart endpoint)
+    // Historical price data (chart endpoint)
     const chartUrl = `https://query1.finance.yahoo.com/v8/finance/chart/${symbol}?interval=1d&range=5d`;
-    const chartResponse = await fetch(chartUrl);
+
+    // Comprehensive financial data (quoteSummary endpoint)
+    const modules = [
+      "financialData",
+      "defaultKeyStatistics",
+      "summaryDetail",
+      "assetProfile",
+    ].join(",");
+
+    const quoteSummaryUrl = `https://query1.finance.yahoo.com/v10/finance/quoteSummary/${symbol}?modules=${modules}`;
+
+    // Both endpoints are on the same host, so fetch them concurrently
+    const [chartResponse, quoteSummaryResponse] = await Promise.all([
+      fetchWithRetry(chartUrl),
+      fetchWithRetry(quoteSummaryUrl),
+    ]);
     const chartData: YahooFinanceResponse = await chartResponse.json();
 
     if (chartData.chart.error || !chartData.chart.result?.[0]) {
       console.error("Yahoo Finance chart API error:", chartData.chart.error);
+      await quoteSummaryResponse.body?.cancel();
       return new Response(
         JSON.stringify({
           error: "Failed to fetch stock data from Yahoo Finance",
@@ -141,16 +158,6 @@ serve(async (req) => {
       );
     }
 
-    // Fetch comprehensive financial data (quoteSummary endpoint)
-    const modules = [
-      "financialData",
-      "defaultKeyStatistics",
-      "summaryDetail",
-      "assetProfile",
-    ].join(",");
-
-    const quoteSummaryUrl = `https://query1.finance.yahoo.com/v10/finance/quoteSummary/${symbol}?modules=${modules}`;
-    const quoteSummaryResponse = await fetch(quoteSummaryUrl);
     const quoteSummaryData: YahooQuoteSummaryResponse =
       await quoteSummaryResponse.json();
 
@@ -1,5 +1,6 @@
 import "jsr:@supabase/functions-js/edge-runtime.d.ts";
 import { serve } from "https://deno.land/std@0.208.0/http/server.ts";
+import { fetchWithRetry } from "../_shared/fetch-retry.ts";
 
 const corsHeaders = {
   "Access-Control-Allow-Origin": "*",
@@ -73,7 +74,7 @@ serve(async (req: Request) => {
     };
 
     // Fetch current price and 1-month historical data for trend analysis
-    const response = await fetch(
+    const response = await fetchWithRetry(
       `https://query1.finance.yahoo.com/v8/finance/chart/${symbol}?interval=1d&range=1mo`,
       { headers: yahooHeaders },
     );
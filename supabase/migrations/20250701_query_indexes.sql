@@ -0,0 +1,19 @@
+-- Composite indexes matching the per-user queries issued by the web app and Telegram bot
+-- Each replaces a single-column index that only covered its leading column
+
+-- Watchlist: listed per user newest first, looked up by (user_id, symbol) on add/remove
+create index if not exists idx_watchlist_user_created on public.watchlist_items(user_id, created_at desc);
+create index if not exists idx_watchlist_user_symbol on public.watchlist_items(user_id, symbol);
+drop index if exists public.idx_watchlist_user_id;
+
+-- Alerts: listed per user newest first, filtered by (user_id, symbol) for active alerts
+create index if not exists idx_alerts_user_created on public.alerts(user_id, created_at desc);
+create index if not exists idx_alerts_user_symbol_active on public.alerts(user_id, symbol) where is_active;
+drop index if exists public.idx_alerts_user_id;
+
+-- Alert monitor scans only active alerts; a partial index beats an index on a boolean
+create index if not exists idx_alerts_active_symbol on public.alerts(symbol) where is_active;
+drop index if exists public.idx_alerts_active;
+
+-- Stock notes: UNIQUE(user_id, symbol) already provides the (user_id, symbol) index
+drop index if exists public.idx_stock_notes_user_id;